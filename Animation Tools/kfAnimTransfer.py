@@ -50,17 +50,14 @@ def kfAnimTransfer():
     cmds.window('kfAnimTransferWin', edit=True, widthHeight=(295, 80))
 
 def kfAT_Obj():
-    sel = cmds.ls(selection=True)
+    sel = cmds.ls(selection=True, long=True)
 
     if len(sel) > 1:
-        cmds.select(sel[0])
-        copySel = cmds.ls(selection=True)
+        # First selected is the source, the rest are the targets
+        copyObj = sel[0]
+        pasteSel = sel[1:]
 
-        cmds.select(sel)
-        cmds.select(copySel[0], toggle=True)
-        pasteSel = cmds.ls(selection=True)
-
-        cmds.copyKey(copySel[0])
+        cmds.copyKey(copyObj)
 
         for obj in pasteSel:
             cmds.pasteKey(obj, option='replaceCompletely', copies=1, connect=1, timeOffset=0, floatOffset=0, valueOffset=0)
@@ -68,46 +65,84 @@ def kfAT_Obj():
         print("\n\nFAIL: Please select at least 2 Objects\n\n")
 
 def kfAT_Hier():
-    sel = cmds.ls(selection=True)
+    sel = cmds.ls(selection=True, long=True)
 
     if len(sel) > 1:
-        cmds.select(sel[0])
-        initHierObj = cmds.ls(selection=True)
-
-        cmds.select(sel)
-        cmds.select(initHierObj[0], toggle=True)
-        goalHierObj = cmds.ls(selection=True)
-
-        # Find out just the goal name space
-        justName = initHierObj[0].split(':')[-1]
-        nameSpaceInit = initHierObj[0].replace(justName, '')
-
-        for goalObj in goalHierObj:
-            justName = goalObj.split(':')[-1]
-            nameSpaceGoal = goalObj.replace(justName, '')
-
-            cmds.select(initHierObj)
-            cmds.select(hierarchy=True)
-            allInit = cmds.ls(selection=True)
-
-            cmds.select(clear=True)
-
-            for initObj in allInit:
-                goalTest = initObj.replace(nameSpaceInit, nameSpaceGoal)
-
-                if cmds.objExists(goalTest):
-                    anyDups = cmds.ls(goalTest)
-
-                    cmds.select(anyDups[0])
-                    goalObj = cmds.ls(selection=True)
-
-                    anyKeys = cmds.keyframe(initObj, query=True, keyframeCount=True)
-
-                    if anyKeys != 0:
-                        cmds.copyKey(initObj)
-                        cmds.pasteKey(goalObj, option='replaceCompletely', copies=1, connect=1, timeOffset=0, floatOffset=0, valueOffset=0)
-
-            print(f"\nSUCCESS: Hierarchy Anim Transfer Complete {goalHierObj.index(goalObj) + 1}/{len(goalHierObj)}")
+        # First selected is the source root, the rest are the goal roots
+        initHierObj = sel[:1]
+        goalHierObj = sel[1:]
+
+        # Find out just the init name space (from the leaf, not the full path)
+        initLeaf = initHierObj[0].split('|')[-1]
+        nameSpaceInit = initLeaf.rpartition(':')[0] + ':' if ':' in initLeaf else ''
+
+        # The source hierarchy is the same for every goal, gather it once
+        allInit = initHierObj + (cmds.listRelatives(initHierObj[0], allDescendents=True, fullPath=True) or [])
+
+        # Only keyed nodes land on the clipboard, so filter them up front to
+        # keep the copied and pasted lists lined up
+        animPlugs = cmds.listConnections(allInit, type='animCurve', source=True, destination=False, connections=True) or []
+        keyedInit = set(cmds.ls([plug.split('.')[0] for plug in animPlugs[::2]], long=True)) if animPlugs else set()
+
+        # One undo entry for the whole transfer, with the evaluation manager
+        # parked so it does not rebuild its graph for every pasted curve
+        emMode = cmds.evaluationManager(query=True, mode=True)[0]
+        cmds.undoInfo(openChunk=True)
+        cmds.evaluationManager(mode='off')
+        try:
+            for goalIndex, goalHier in enumerate(goalHierObj):
+                goalLeaf = goalHier.split('|')[-1]
+                nameSpaceGoal = goalLeaf.rpartition(':')[0] + ':' if ':' in goalLeaf else ''
+
+                # Swap the name space on each keyed node's own name, as before, so a goal
+                # node is found wherever it sits in the scene
+                goalNames = {}
+                for initObj in allInit:
+                    if initObj not in keyedInit:
+                        continue
+                    initName = initObj.split('|')[-1]
+                    goalNames[initObj] = initName.replace(nameSpaceInit, nameSpaceGoal) if nameSpaceInit else initName
+
+                # Resolve every goal name with one ls; the long names only break ties,
+                # preferring the node at the same path under this goal root, then any
+                # match inside this goal's hierarchy, then the first one found
+                matches = {}
+                for goalTest in (cmds.ls(list(set(goalNames.values())), long=True) if goalNames else []):
+                    matches.setdefault(goalTest.split('|')[-1], []).append(goalTest)
+
+                pairs = []
+                for initObj, goalName in goalNames.items():
+                    found = matches.get(goalName)
+                    if not found:
+                        continue
+                    relPath = initObj[len(initHierObj[0]):]
+                    if nameSpaceInit:
+                        relPath = relPath.replace('|' + nameSpaceInit, '|' + nameSpaceGoal)
+                    if goalHier + relPath in found:
+                        goalObj = goalHier + relPath
+                    else:
+                        inGoal = [m for m in found if m == goalHier or m.startswith(goalHier + '|')]
+                        goalObj = (inGoal or found)[0]
+                    if goalObj != initObj:
+                        pairs.append((initObj, goalObj))
+
+                # One copyKey/pasteKey pair only lines up while every destination is
+                # distinct: Maya collapses repeated objects, which would shift the rest
+                # of the clipboard onto the wrong nodes, so paste pair by pair instead
+                pasteArgs = dict(option='replaceCompletely', copies=1, connect=1, timeOffset=0, floatOffset=0, valueOffset=0)
+                if len(set(dst for _, dst in pairs)) == len(pairs):
+                    if pairs:
+                        cmds.copyKey([src for src, _ in pairs])
+                        cmds.pasteKey([dst for _, dst in pairs], **pasteArgs)
+                else:
+                    for src, dst in pairs:
+                        cmds.copyKey(src)
+                        cmds.pasteKey(dst, **pasteArgs)
+
+                print(f"\nSUCCESS: Hierarchy Anim Transfer Complete {goalIndex + 1}/{len(goalHierObj)}")
+        finally:
+            cmds.evaluationManager(mode=emMode)
+            cmds.undoInfo(closeChunk=True)
     else:
         print("\n\nFAIL: Please select at least 2 Objects\n\n")
 
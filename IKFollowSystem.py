@@ -1,3 +1,5 @@
+import functools
+
 import maya.cmds as cmds
 
 # ======================================================
@@ -9,16 +11,49 @@ import maya.cmds as cmds
 # ======================================================
 
 
-def _safe_short_name(obj):
-    sn = cmds.ls(obj, sn=True)
-    return sn[0] if sn else obj
+# Characters that are unsafe in node names, all mapped to '_'
+_UNSAFE_NAME_CHARS = str.maketrans('|: -.', '_____')
 
 
+@functools.lru_cache(maxsize=None)
 def _sanitize_node_name(name):
     # Replace characters that are unsafe in node names
-    for ch in ['|', ':', ' ', '-', '.']:
-        name = name.replace(ch, '_')
-    return name
+    return name.translate(_UNSAFE_NAME_CHARS)
+
+
+def _add_follow_chain(connections, follow_attr, weight_attr, existing, safe_label, enum_val):
+    # Create condition -> multDoubleLinear for one constraint weight; the
+    # connections are queued on the caller's list and made once every node exists
+
+    # Create condition node
+    cond = cmds.createNode(
+        "condition",
+        n=f"{safe_label}_Follow_COND",
+        skipSelect=True
+    )
+
+    cmds.setAttr(f"{cond}.operation", 0)      # Equal
+    cmds.setAttr(f"{cond}.secondTerm", enum_val)
+    cmds.setAttr(f"{cond}.colorIfTrueR", 1)
+    cmds.setAttr(f"{cond}.colorIfFalseR", 0)
+
+    # Create a simple multiplier node so the Connection Editor shows
+    # an explicit chain (and to allow future scaling if needed).
+    mdl = cmds.createNode('multDoubleLinear', n=f"{safe_label}_Follow_MDL", skipSelect=True)
+    # Ensure it multiplies by 1
+    cmds.setAttr(f"{mdl}.input2", 1)
+
+    # If the constraint weight has existing incoming connections, break them
+    for src in existing:
+        try:
+            cmds.disconnectAttr(src, weight_attr)
+        except Exception:
+            pass
+
+    # enum attr -> condition.firstTerm -> multiplier -> constraint weight
+    connections.append((follow_attr, f"{cond}.firstTerm"))
+    connections.append((f"{cond}.outColorR", f"{mdl}.input1"))
+    connections.append((f"{mdl}.output", weight_attr))
 
 
 def addIKFollowSystem(ik_ctrl, cog_ctrl, trans_ctrl, world_ctrl):
@@ -27,154 +62,94 @@ def addIKFollowSystem(ik_ctrl, cog_ctrl, trans_ctrl, world_ctrl):
         if not cmds.objExists(obj):
             cmds.error(f"{obj} does not exist.")
 
+    # Checked before anything is built, so a bad pick never leaves a half-made
+    # constraint behind (three targets are needed for the three weights below)
+    if len(set(cmds.ls([cog_ctrl, trans_ctrl, world_ctrl], long=True))) != 3:
+        cmds.error("COG, Transform and World controls must be three different objects.")
+
     parent = cmds.listRelatives(ik_ctrl, parent=True)
     if not parent:
         cmds.error("IK control must be grouped.")
     grp = parent[0]
 
-    # ---------------------------
-    # ATTRIBUTE
-    # ---------------------------
-    if not cmds.attributeQuery("FollowTarget", node=ik_ctrl, exists=True):
-        cmds.addAttr(
-            ik_ctrl,
-            ln="FollowTarget",
-            at="enum",
-            en="None:COG:Transform:World",
-            k=True
-        )
-        cmds.setAttr(f"{ik_ctrl}.FollowTarget", 0)
-
-    # ---------------------------
-    # CONSTRAINT
-    # ---------------------------
-    pcon = cmds.parentConstraint(
-        cog_ctrl,
-        trans_ctrl,
-        world_ctrl,
-        grp,
-        mo=True,
-        n=f"{_sanitize_node_name(ik_ctrl)}_Follow_PCon"
-    )[0]
-
-    weights = cmds.parentConstraint(pcon, q=True, wal=True)
-    # Try to get the ordered list of targets for robust mapping
+    # One undo entry for the whole build, and no cycle checking while the
+    # network is wired up (restored afterwards)
+    cycle_check = cmds.cycleCheck(q=True, evaluation=True)
+    cmds.undoInfo(openChunk=True)
+    cmds.cycleCheck(evaluation=False)
     try:
-        targets = cmds.parentConstraint(pcon, q=True, tl=True)
-    except Exception:
-        try:
-            targets = cmds.parentConstraint(pcon, q=True, t=True)
-        except Exception:
-            targets = None
-
-    # ---------------------------
-    # TARGET ENUM VALUES
-    # ---------------------------
-    enum_map = {
-        "COG": 1,
-        "TRANSFORM": 2,
-        "WORLD": 3
-    }
-
-    # get short names for matching
-    cog_sn = _safe_short_name(cog_ctrl).lower()
-    trans_sn = _safe_short_name(trans_ctrl).lower()
-    world_sn = _safe_short_name(world_ctrl).lower()
-
-    # ---------------------------
-    # EXCLUSIVE WEIGHT LOGIC (robust mapping)
-    # Map each weight to its corresponding target by index when possible.
-    # Build explicit node chains: condition -> multDoubleLinear -> weight
-    # ---------------------------
-    for idx, weight in enumerate(weights):
-        # Determine the target this weight corresponds to
-        target_obj = None
-        if targets and idx < len(targets):
-            target_obj = targets[idx]
-
-        label = weight.split("W")[0]
-        label_clean = label.upper()
-
-        enum_val = None
-        # Prefer explicit target mapping if available
-        if target_obj:
-            target_sn = _safe_short_name(target_obj).lower()
-            if target_sn == cog_sn:
-                enum_val = enum_map["COG"]
-            elif target_sn == trans_sn:
-                enum_val = enum_map["TRANSFORM"]
-            elif target_sn == world_sn:
-                enum_val = enum_map["WORLD"]
-        else:
-            # Fallback to substring matching on the weight label
-            if cog_sn in label.lower():
-                enum_val = enum_map["COG"]
-            elif trans_sn in label.lower():
-                enum_val = enum_map["TRANSFORM"]
-            elif world_sn in label.lower():
-                enum_val = enum_map["WORLD"]
-
-        if enum_val is None:
-            # Could not match weight to any provided source; skip
-            continue
-
-        safe_label = _sanitize_node_name(f"{_sanitize_node_name(ik_ctrl)}_{label_clean}")
-
-        # Create condition node
-        cond = cmds.createNode(
-            "condition",
-            n=f"{safe_label}_Follow_COND"
-        )
-
-        cmds.setAttr(f"{cond}.operation", 0)      # Equal
-        cmds.setAttr(f"{cond}.secondTerm", enum_val)
-        cmds.setAttr(f"{cond}.colorIfTrueR", 1)
-        cmds.setAttr(f"{cond}.colorIfFalseR", 0)
-
-        # Connect enum attr to condition.firstTerm
-        try:
-            cmds.connectAttr(
-                f"{ik_ctrl}.FollowTarget",
-                f"{cond}.firstTerm",
-                force=True
+        # ---------------------------
+        # ATTRIBUTE
+        # ---------------------------
+        if not cmds.attributeQuery("FollowTarget", node=ik_ctrl, exists=True):
+            cmds.addAttr(
+                ik_ctrl,
+                ln="FollowTarget",
+                at="enum",
+                en="None:COG:Transform:World",
+                dv=0,
+                k=True
             )
-        except Exception:
-            # If the enum is already connected elsewhere, leave it
-            pass
 
-        # Create a simple multiplier node so the Connection Editor shows
-        # an explicit chain (and to allow future scaling if needed).
-        mdl = cmds.createNode('multDoubleLinear', n=f"{safe_label}_Follow_MDL")
-        # Ensure it multiplies by 1
-        try:
-            cmds.setAttr(f"{mdl}.input2", 1)
-        except Exception:
-            pass
-
-        # Connect condition output to multiplier input1
-        try:
-            cmds.connectAttr(f"{cond}.outColorR", f"{mdl}.input1", force=True)
-        except Exception:
-            pass
-
-        # If the constraint weight has existing incoming connections, break them
-        existing = cmds.listConnections(f"{pcon}.{weight}", s=True, d=False, plugs=True)
-        if existing:
-            for src in existing:
-                try:
-                    cmds.disconnectAttr(src, f"{pcon}.{weight}")
-                except Exception:
-                    pass
+        ik_safe = _sanitize_node_name(ik_ctrl)
+
+        # ---------------------------
+        # CONSTRAINT
+        # ---------------------------
+        pcon = cmds.parentConstraint(
+            cog_ctrl,
+            trans_ctrl,
+            world_ctrl,
+            grp,
+            mo=True,
+            n=f"{ik_safe}_Follow_PCon"
+        )[0]
+
+        # Weights come back in target order: COG, Transform, World
+        weights = cmds.parentConstraint(pcon, q=True, wal=True)
+        cog_w, trans_w, world_w = weights
+
+        # ---------------------------
+        # EXCLUSIVE WEIGHT LOGIC
+        # Build explicit node chains: condition -> multDoubleLinear -> weight
+        # ---------------------------
+
+        # Gather any incoming weight connections in one pass before touching the DG
+        existing_map = {
+            w: cmds.listConnections(f"{pcon}.{w}", s=True, d=False, plugs=True) or []
+            for w in weights
+        }
+
+        # Connections are queued and made once every node exists, so the DG is
+        # only dirtied after construction instead of between each createNode
+        connections = []
+        # Plug names shared by the three chains are built once
+        follow_attr = f"{ik_ctrl}.FollowTarget"
+
+        # COG -> FollowTarget 1
+        _add_follow_chain(
+            connections, follow_attr, f"{pcon}.{cog_w}", existing_map[cog_w],
+            _sanitize_node_name(f"{ik_safe}_{cog_w.split('W')[0].upper()}"), 1
+        )
+        # Transform -> FollowTarget 2
+        _add_follow_chain(
+            connections, follow_attr, f"{pcon}.{trans_w}", existing_map[trans_w],
+            _sanitize_node_name(f"{ik_safe}_{trans_w.split('W')[0].upper()}"), 2
+        )
+        # World -> FollowTarget 3
+        _add_follow_chain(
+            connections, follow_attr, f"{pcon}.{world_w}", existing_map[world_w],
+            _sanitize_node_name(f"{ik_safe}_{world_w.split('W')[0].upper()}"), 3
+        )
 
-        # Connect final output to the constraint weight
-        try:
-            cmds.connectAttr(f"{mdl}.output", f"{pcon}.{weight}", force=True)
-        except Exception:
-            # Fallback: connect condition directly
+        for src, dst in connections:
             try:
-                cmds.connectAttr(f"{cond}.outColorR", f"{pcon}.{weight}", force=True)
-            except Exception:
-                pass
+                cmds.connectAttr(src, dst, force=True)
+            except Exception as e:
+                cmds.warning(f"Could not connect {src} -> {dst}: {e}")
+    finally:
+        cmds.cycleCheck(evaluation=cycle_check)
+        cmds.undoInfo(closeChunk=True)
 
     print(f"Follow system added to {ik_ctrl}")
 
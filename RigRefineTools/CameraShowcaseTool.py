@@ -1,4 +1,8 @@
+import time
+
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
+import maya.mel as mel
 
 # ------------------------------------------------------------
 # CONSTANTS
@@ -13,6 +17,27 @@ AIM_LOC   = "Cam_Aim_Loc"
 SLIDERS = {}
 ORBIT_ACCUM = 0.0
 
+# Orbit drag updates are capped at ~60 Hz
+ORBIT_INTERVAL = 1.0 / 60.0
+_LAST_ORBIT_EMIT = 0.0
+# Latest slider value from a dropped drag event, applied on release if nothing emitted after it
+_ORBIT_PENDING = 0.0
+
+# (node, attr) -> (MObjectHandle, MPlug), resolved once for the drag callbacks
+_PLUGS = {}
+
+def _rig_plug(node, attr):
+    """Return a cached MPlug for node.attr, re-resolving it if the node was deleted/recreated."""
+    cached = _PLUGS.get((node, attr))
+    if cached and cached[0].isValid():
+        return cached[1]
+    sel = om.MSelectionList()
+    sel.add(node)
+    obj = sel.getDependNode(0)
+    plug = om.MFnDependencyNode(obj).findPlug(attr, False)
+    _PLUGS[(node, attr)] = (om.MObjectHandle(obj), plug)
+    return plug
+
 # RIG CREATION
 def create_camera_rig():
 
@@ -20,71 +45,104 @@ def create_camera_rig():
         # Rig already exists — do NOT recreate
         return
 
-    rig_grp = cmds.group(em=True, name=RIG_GRP)
+    # A fresh rig means fresh nodes; drop any plugs resolved for an old one
+    _PLUGS.clear()
+
+    # One undo step for the whole rig
+    cmds.undoInfo(openChunk=True, chunkName="createCameraRig")
+    try:
+        rig_grp = cmds.group(em=True, name=RIG_GRP)
 
-    cmds.addAttr(rig_grp, ln="globalScale", at="double", dv=1, min=0.001)
-    cmds.setAttr(rig_grp + ".globalScale", e=True, keyable=True)
-    for ax in "XYZ":
-        cmds.connectAttr(rig_grp + ".globalScale", f"{rig_grp}.scale{ax}")
+        cmds.addAttr(rig_grp, ln="globalScale", at="double", dv=1, min=0.001)
+        cmds.setAttr(rig_grp + ".globalScale", e=True, keyable=True)
+        mel.eval("".join(
+            f'connectAttr "{rig_grp}.globalScale" "{rig_grp}.scale{ax}";' for ax in "XYZ"
+        ))
 
-    aim = cmds.spaceLocator(name=AIM_LOC)[0]
-    cmds.parent(aim, rig_grp)
+        aim = cmds.spaceLocator(name=AIM_LOC)[0]
+        cmds.parent(aim, rig_grp)
 
-    orbit_grp = cmds.group(em=True, name=ORBIT_GRP, parent=rig_grp)
-    anim_grp  = cmds.group(em=True, name=ANIM_GRP, parent=orbit_grp)
-    rot_grp   = cmds.group(em=True, name=ROT_GRP, parent=anim_grp)
+        # createNode takes the parent directly and leaves the selection alone
+        orbit_grp = cmds.createNode("transform", name=ORBIT_GRP, parent=rig_grp, skipSelect=True)
+        anim_grp  = cmds.createNode("transform", name=ANIM_GRP, parent=orbit_grp, skipSelect=True)
+        rot_grp   = cmds.createNode("transform", name=ROT_GRP, parent=anim_grp, skipSelect=True)
 
-    cam = cmds.camera(name=CAM_NAME)[0]
-    cmds.parent(cam, rot_grp)
+        cam = cmds.camera(name=CAM_NAME)[0]
+        cam = cmds.parent(cam, rot_grp)[0]
 
-    cmds.aimConstraint(
-        aim,
-        cam,
-        aimVector=(0, 0, -1),
-        upVector=(0, 1, 0),
-        worldUpType="scene"
-    )
+        cmds.aimConstraint(
+            aim,
+            cam,
+            aimVector=(0, 0, -1),
+            upVector=(0, 1, 0),
+            worldUpType="scene"
+        )
 
-    # Lock camera scale only
-    for a in ["sx", "sy", "sz"]:
-        cmds.setAttr(cam + "." + a, lock=True, keyable=False)
+        trs = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]
+        channel_edits = []
 
-    # Make camera transform channels keyable so the rig is animatable via timeline.
-    # Keep scale locked but allow translate/rotate to be keyed if needed.
-    for a in ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]:
-        cmds.setAttr(cam + "." + a, e=True, keyable=True)
+        # Lock camera scale only
+        channel_edits += [f'setAttr -lock 1 -keyable 0 "{cam}.{a}";' for a in ["sx", "sy", "sz"]]
 
-    # Ensure the important group nodes are keyable so you can animate dolly/truck/pedestal/orbit
-    for grp in (orbit_grp, anim_grp, rot_grp):
-        for a in ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]:
-            cmds.setAttr(grp + "." + a, e=True, keyable=True)
+        # Make camera transform channels keyable so the rig is animatable via timeline.
+        # Keep scale locked but allow translate/rotate to be keyed if needed.
+        # Ensure the important group nodes are keyable so you can animate dolly/truck/pedestal/orbit
+        for node in (cam, orbit_grp, anim_grp, rot_grp):
+            channel_edits += [f'setAttr -e -keyable 1 "{node}.{a}";' for a in trs]
 
-    # Default orbit radius
-    cmds.setAttr(anim_grp + ".translateZ", 20)
+        # Default orbit radius
+        channel_edits.append(f'setAttr "{anim_grp}.translateZ" 20;')
+
+        # Every channel flag and default in a single undoable MEL call
+        mel.eval("".join(channel_edits))
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
 # SLIDER CALLBACKS
+# These fire continuously while dragging, so they write straight to cached
+# plugs instead of going through setAttr (and its undo queue) every tick.
 def set_dolly(val):
-    cmds.setAttr(ANIM_GRP + ".translateZ", val)
+    _rig_plug(ANIM_GRP, "translateZ").setDouble(val)
 
 def set_truck(val):
-    cmds.setAttr(ANIM_GRP + ".translateX", val)
+    _rig_plug(ANIM_GRP, "translateX").setDouble(val)
 
 def set_pedestal(val):
-    cmds.setAttr(ANIM_GRP + ".translateY", val)
+    _rig_plug(ANIM_GRP, "translateY").setDouble(val)
 
-def orbit_drag(val):
-    """Infinite orbit using delta accumulation"""
+def _apply_orbit(val):
     global ORBIT_ACCUM
-
     ORBIT_ACCUM += val
-    cmds.setAttr(ORBIT_GRP + ".rotateY", ORBIT_ACCUM)
+    _rig_plug(ORBIT_GRP, "rotateY").setMAngle(om.MAngle(ORBIT_ACCUM, om.MAngle.kDegrees))
 
     # Reset slider back to center
     cmds.floatSlider(SLIDERS["orbit"], e=True, value=0)
 
+def orbit_drag(val):
+    """Infinite orbit using delta accumulation"""
+    global _LAST_ORBIT_EMIT, _ORBIT_PENDING
+
+    # The slider only snaps back to 0 when we emit, so a dropped event's value
+    # already includes every movement since the last emit; keep just the latest
+    now = time.perf_counter()
+    if now - _LAST_ORBIT_EMIT < ORBIT_INTERVAL:
+        _ORBIT_PENDING = val
+        return
+    _LAST_ORBIT_EMIT = now
+    _ORBIT_PENDING = 0.0
+    _apply_orbit(val)
+
+def orbit_release(*_):
+    """Apply the delta of a drag whose last events were throttled away."""
+    global _ORBIT_PENDING
+    if _ORBIT_PENDING:
+        val, _ORBIT_PENDING = _ORBIT_PENDING, 0.0
+        _apply_orbit(val)
+
 def reset_camera(*_):
-    global ORBIT_ACCUM
+    global ORBIT_ACCUM, _ORBIT_PENDING
     ORBIT_ACCUM = 0.0
+    _ORBIT_PENDING = 0.0
 
     cmds.setAttr(ANIM_GRP + ".translate", 0, 0, 20)
     cmds.setAttr(ORBIT_GRP + ".rotate", 0, 0, 0)
@@ -102,43 +160,51 @@ def camera_dolly_ui():
     if cmds.window(win, exists=True):
         cmds.deleteUI(win)
 
-    cmds.window(win, title="Camera Orbit / Dolly Controls", widthHeight=(320, 300))
-    cmds.columnLayout(adj=True, rowSpacing=8)
-
-    cmds.text(label="Dolly (Radius)")
-    SLIDERS["dolly"] = cmds.floatSlider(
-        min=1, max=300, value=20, step=0.1,
-        dragCommand=set_dolly
-    )
-
-    cmds.text(label="Truck")
-    SLIDERS["truck"] = cmds.floatSlider(
-        min=-150, max=150, value=0, step=0.1,
-        dragCommand=set_truck
-    )
-
-    cmds.text(label="Pedestal")
-    SLIDERS["pedestal"] = cmds.floatSlider(
-        min=-150, max=150, value=0, step=0.1,
-        dragCommand=set_pedestal
-    )
-
-    cmds.separator(h=8, style="in")
-
-    cmds.text(label="Orbit (Infinite)")
-    SLIDERS["orbit"] = cmds.floatSlider(
-        min=-10, max=10, value=0, step=0.1,
-        dragCommand=orbit_drag
-    )
-
-    cmds.separator(h=12)
-    cmds.button(label="Reset Camera", height=32, command=reset_camera)
+    # Hold viewport redraws until the dolly/orbit slider column is laid out
+    cmds.refresh(suspend=True)
+    try:
+        cmds.window(win, title="Camera Orbit / Dolly Controls", widthHeight=(320, 300))
+        cmds.columnLayout(adj=True, rowSpacing=8)
+
+        cmds.text(label="Dolly (Radius)")
+        SLIDERS["dolly"] = cmds.floatSlider(
+            min=1, max=300, value=20, step=0.1,
+            dragCommand=set_dolly
+        )
+
+        cmds.text(label="Truck")
+        SLIDERS["truck"] = cmds.floatSlider(
+            min=-150, max=150, value=0, step=0.1,
+            dragCommand=set_truck
+        )
+
+        cmds.text(label="Pedestal")
+        SLIDERS["pedestal"] = cmds.floatSlider(
+            min=-150, max=150, value=0, step=0.1,
+            dragCommand=set_pedestal
+        )
+
+        cmds.separator(h=8, style="in")
+
+        cmds.text(label="Orbit (Infinite)")
+        SLIDERS["orbit"] = cmds.floatSlider(
+            min=-10, max=10, value=0, step=0.1,
+            dragCommand=orbit_drag,
+            changeCommand=orbit_release
+        )
+
+        cmds.separator(h=12)
+        cmds.button(label="Reset Camera", height=32, command=reset_camera)
+    finally:
+        cmds.refresh(suspend=False)
 
     cmds.showWindow(win)
 
 
 def launch_camera_tool():
-    create_camera_rig()
     camera_dolly_ui()
+    # Build the rig on the next idle tick so the window paints first
+    cmds.evalDeferred(create_camera_rig, lowestPriority=True)
 
-launch_camera_tool()
+if __name__ == "__main__":
+    launch_camera_tool()
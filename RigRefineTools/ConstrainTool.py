@@ -3,61 +3,63 @@ import maya.cmds as cmds
 WIN = 'constrainToolUI'
 
 def _get_parent_and_children():
-    sels = cmds.ls(selection=True) or []
+    sels = cmds.ls(selection=True, long=True) or []
     if len(sels) < 2:
         cmds.warning('Select parent first, then one or more children.')
         return None, []
     return sels[0], sels[1:]
 
+def _constrain_children(constraint_cmd, label, parent, children, **kwargs):
+    # parentConstraint(a, b, c) treats every object but the last as a target,
+    # so each child still needs its own call; one undo chunk covers them all
+    cmds.undoInfo(openChunk=True)
+    try:
+        for child in children:
+            try:
+                constraint_cmd(parent, child, **kwargs)
+            except Exception as e:
+                cmds.warning('{} failed: {} -> {} | {}'.format(label, parent, child, e))
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
 def createParentConstraint(*args):
     parent, children = _get_parent_and_children()
     if not parent or not children:
         return
     mo = cmds.checkBox('ct_mo', q=True, v=True)
-    for child in children:
-        try:
-            cmds.parentConstraint(parent, child, mo=mo)
-        except Exception as e:
-            cmds.warning('ParentConstraint failed: {} -> {} | {}'.format(parent, child, e))
+    _constrain_children(cmds.parentConstraint, 'ParentConstraint', parent, children, mo=mo)
 
 def createOrientConstraint(*args):
     parent, children = _get_parent_and_children()
     if not parent or not children:
         return
     mo = cmds.checkBox('ct_mo', q=True, v=True)
-    for child in children:
-        try:
-            cmds.orientConstraint(parent, child, mo=mo)
-        except Exception as e:
-            cmds.warning('OrientConstraint failed: {} -> {} | {}'.format(parent, child, e))
+    _constrain_children(cmds.orientConstraint, 'OrientConstraint', parent, children, mo=mo)
 
 def createScaleConstraint(*args):
     parent, children = _get_parent_and_children()
     if not parent or not children:
         return
-    for child in children:
-        try:
-            cmds.scaleConstraint(parent, child)
-        except Exception as e:
-            cmds.warning('ScaleConstraint failed: {} -> {} | {}'.format(parent, child, e))
+    _constrain_children(cmds.scaleConstraint, 'ScaleConstraint', parent, children)
 
 def clearConstraintsOnChildren(*args):
     _, children = _get_parent_and_children()
     if not children:
         return
-    for child in children:
-        cons = []
-        # Constraints living under the child transform (typical)
-        cons += cmds.listRelatives(child, type='parentConstraint') or []
-        cons += cmds.listRelatives(child, type='orientConstraint') or []
-        cons += cmds.listRelatives(child, type='scaleConstraint') or []
-        # Also check connected constraints just in case
-        cons += cmds.listConnections(child, type='parentConstraint') or []
-        cons += cmds.listConnections(child, type='orientConstraint') or []
-        cons += cmds.listConnections(child, type='scaleConstraint') or []
-        cons = list(set(cons))
-        if cons:
+    constraint_types = ['parentConstraint', 'orientConstraint', 'scaleConstraint']
+    # Constraints living under the child transforms (typical)
+    cons = cmds.listRelatives(children, type=constraint_types) or []
+    # Also check connected constraints just in case
+    cons += cmds.listConnections(children, type='constraint') or []
+    if cons:
+        # Narrow the connected constraints back down to the three types this tool manages
+        cons = cmds.ls(list(set(cons)), type=constraint_types)
+    if cons:
+        cmds.undoInfo(openChunk=True)
+        try:
             cmds.delete(cons)
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
 def createUI(*args):
     if cmds.window(WIN, exists=True):
@@ -72,17 +74,18 @@ def createUI(*args):
     cmds.rowLayout(numberOfColumns=3, adj=1,
                    columnAttach=[(1,'both',0),(2,'both',0),(3,'both',0)],
                    columnWidth=[(1,140),(2,140),(3,140)])
-    cmds.button(label='Parent Constraint', c='createParentConstraint()')
-    cmds.button(label='Orient Constraint', c='createOrientConstraint()')
-    cmds.button(label='Scale Constraint', c='createScaleConstraint()')
+    cmds.button(label='Parent Constraint', c=lambda *_: createParentConstraint())
+    cmds.button(label='Orient Constraint', c=lambda *_: createOrientConstraint())
+    cmds.button(label='Scale Constraint', c=lambda *_: createScaleConstraint())
     cmds.setParent('..')
 
     cmds.separator(h=6, style='none')
-    cmds.button(label='Clear Constraints on Selected Children', c='clearConstraintsOnChildren()')
+    cmds.button(label='Clear Constraints on Selected Children', c=lambda *_: clearConstraintsOnChildren())
 
     cmds.separator(h=6, style='none')
-    cmds.button(label='Refresh Selection', c='cmds.select(cmds.ls(sl=True))')
+    cmds.button(label='Refresh Selection', c=lambda *_: cmds.select(cmds.ls(sl=True)))
 
     cmds.showWindow(WIN)
 
-createUI()
\ No newline at end of file
+if __name__ == '__main__':
+    createUI()
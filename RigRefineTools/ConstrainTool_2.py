@@ -19,18 +19,25 @@ def match_controls_to_joints(suffix_joint='_Jnt', suffix_ctrl='_Ctrl', maintain_
     """
     # collect joints
     joints = cmds.ls('*' + suffix_joint, type='joint') or []
+    if not joints:
+        # nothing to match against, skip the scene-wide transform scan
+        cmds.warning('No joints found with suffix: %s' % suffix_joint)
+        return []
 
     # collect transforms that look like controls (ending with suffix)
     all_transforms = cmds.ls(type='transform') or []
-    ctrls = [t for t in all_transforms if t.endswith(suffix_ctrl)]
 
-    def base_name(name, suffix):
-        if name.endswith(suffix):
-            return name[:-len(suffix)]
-        return None
+    def base_map(names, suffix):
+        """Map base name -> node for every name ending with suffix (and not just the suffix)."""
+        cut = -len(suffix)
+        mapping = {}
+        for name in names:
+            if name.endswith(suffix) and name[:cut]:
+                mapping[name[:cut]] = name
+        return mapping
 
-    joint_map = {base_name(j, suffix_joint): j for j in joints if base_name(j, suffix_joint)}
-    ctrl_map = {base_name(c, suffix_ctrl): c for c in ctrls if base_name(c, suffix_ctrl)}
+    joint_map = base_map(joints, suffix_joint)
+    ctrl_map = base_map(all_transforms, suffix_ctrl)
 
     pairs = []
     for b, j in joint_map.items():
@@ -42,20 +49,19 @@ def match_controls_to_joints(suffix_joint='_Jnt', suffix_ctrl='_Ctrl', maintain_
         cmds.warning('No matching control/joint pairs found using suffixes: %s, %s' % (suffix_joint, suffix_ctrl))
         return []
 
-    def is_joint_constrained(jnt):
-        """Return True if the joint already has constraint nodes connected to it."""
+    # gather every joint connected to a constraint once, so the per-pair check is a set lookup
+    constrained_joints = set()
+    if ignore_constrained:
         constraint_types = ['parentConstraint', 'pointConstraint', 'orientConstraint', 'scaleConstraint', 'aimConstraint']
-        for ct in constraint_types:
-            conns = cmds.listConnections(jnt, type=ct) or []
-            if conns:
-                return True
-        return False
+        constraints = cmds.ls(type=constraint_types) or []
+        if constraints:
+            constrained_joints.update(cmds.listConnections(constraints, type='joint') or [])
 
     created = []
     cmds.undoInfo(openChunk=True)
     try:
         for c, j in pairs:
-            if ignore_constrained and is_joint_constrained(j):
+            if ignore_constrained and j in constrained_joints:
                 # skip joints that already have constraints
                 continue
             if ignore_ik_joints and 'IK' in j:
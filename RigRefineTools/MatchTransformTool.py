@@ -1,20 +1,30 @@
 import maya.cmds as cmds
+import maya.mel as mel
 
 def freezeTransforms():
-    selection = cmds.ls(selection=True)
-    for obj in selection:
-        cmds.DeleteHistory(obj)
-        cmds.FreezeTransformations(obj)
+    selection = cmds.ls(selection=True, long=True)
+    if not selection:
+        return
+    # both commands take the whole list, so history and freeze are one pass each
+    cmds.undoInfo(openChunk=True)
+    try:
+        cmds.delete(selection, constructionHistory=True)
+        cmds.makeIdentity(selection, apply=True, t=1, r=1, s=1, n=0)
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
 def attributesSetZero():
     selection = cmds.ls(selection=True)
-    for obj in selection:
-        cmds.setAttr('{}.rx'.format(obj), 0)
-        cmds.setAttr('{}.ry'.format(obj), 0)
-        cmds.setAttr('{}.rz'.format(obj), 0)
-        cmds.setAttr('{}.sx'.format(obj), 1)
-        cmds.setAttr('{}.sy'.format(obj), 1)
-        cmds.setAttr('{}.sz'.format(obj), 1)
+    if not selection:
+        return
+    # rotate and scale for the whole selection in one MEL eval / one undo step
+    cmds.undoInfo(openChunk=True)
+    try:
+        mel.eval(''.join(
+            'setAttr "{0}.rotate" 0 0 0; setAttr "{0}.scale" 1 1 1;'.format(obj) for obj in selection
+        ))
+    finally:
+        cmds.undoInfo(closeChunk=True)
         
 
 def matchTransforms():
@@ -40,10 +50,10 @@ def createUI():
         cmds.deleteUI('matchTransformUI', window=True)
     cmds.window('matchTransformUI', title='Match Transform Tool', widthHeight=(200, 180), sizeable=False)
     cmds.columnLayout(adjustableColumn=True)
-    cmds.button(label='Freeze Transforms', command='freezeTransforms()')
-    cmds.button(label='Set Attributes to Zero', command='attributesSetZero()')
-    cmds.button(label='Match Transforms', command='matchTransforms()')
-    cmds.button(label='Create Group', command='createGroup()')
+    cmds.button(label='Freeze Transforms', command=lambda *a: freezeTransforms())
+    cmds.button(label='Set Attributes to Zero', command=lambda *a: attributesSetZero())
+    cmds.button(label='Match Transforms', command=lambda *a: matchTransforms())
+    cmds.button(label='Create Group', command=lambda *a: createGroup())
     cmds.showWindow('matchTransformUI')
 
 createUI()
@@ -3,24 +3,81 @@
     Run in Maya Script Editor (Python tab) or save as a module and import.
     Select controls and use the UI to enable overrides / change colors.
 """
+import contextlib
+
 import maya.cmds as cmds
+import maya.mel as mel
 
 WINDOW = "colorToCurveUI"
 
+# overrideRGBColors/overrideColorRGB live on dagNode itself, so whether they exist
+# depends on the Maya version only; probe once and reuse the answer
+_HAS_RGB_OVERRIDE = None
+
+
+def _has_rgb_override(node):
+    global _HAS_RGB_OVERRIDE
+    if _HAS_RGB_OVERRIDE is None:
+        _HAS_RGB_OVERRIDE = cmds.attributeQuery("overrideRGBColors", node=node, exists=True)
+    return _HAS_RGB_OVERRIDE
+
+
+@contextlib.contextmanager
+def _color_edit_chunk(chunk_name):
+    """Group a batch of color edits into one undo step with viewport refresh suspended."""
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+
+
+def _apply_index_color(nodes, color_index):
+    """Set overrideEnabled/overrideColor (and clear RGB override) on nodes in a single MEL eval."""
+    if not nodes:
+        return
+    color_index = int(color_index)
+    has_rgb = _has_rgb_override(nodes[0])
+    statements = []
+    for node in nodes:
+        statements.append('setAttr "{0}.overrideEnabled" 1; setAttr "{0}.overrideColor" {1};'.format(node, color_index))
+        if has_rgb:
+            statements.append('setAttr "{0}.overrideRGBColors" 0;'.format(node))
+    try:
+        mel.eval("".join(statements))
+    except RuntimeError:
+        # a bad node aborts the batch; redo it per node so the others still get colored
+        for node in nodes:
+            try:
+                cmds.setAttr(node + ".overrideEnabled", 1)
+                cmds.setAttr(node + ".overrideColor", color_index)
+                if has_rgb:
+                    cmds.setAttr(node + ".overrideRGBColors", 0)
+            except Exception as e:
+                cmds.warning("Failed to set color on {}: {}".format(node, e))
+
+
+def _split_selection(sel):
+    """Return (shapes under sel, shapeless DAG nodes in sel) using list-wide queries instead of per-node checks."""
+    shapes = cmds.listRelatives(sel, shapes=True, fullPath=True) or []
+    owners = set(cmds.listRelatives(shapes, parent=True, fullPath=True) or []) if shapes else set()
+    shapeless = [node for node in sel if node not in owners]
+    # joints / transforms (any DAG node carries the override attributes)
+    shapeless = (cmds.ls(shapeless, type="dagNode", long=True) or []) if shapeless else []
+    return shapes, shapeless
+
 
 def enable_color_override_on_selection():
     sel = cmds.ls(sl=True, long=True) or []
     for node in sel:
         shapes = cmds.listRelatives(node, shapes=True, fullPath=True) or []
-        if shapes:
-            for shp in shapes:
-                try:
-                    cmds.setAttr(shp + ".overrideEnabled", 1)
-                except Exception:
-                    pass
-        else:
+        for shp in shapes or [node]:
             try:
-                cmds.setAttr(node + ".overrideEnabled", 1)
+                # reading is cheap; only write (dirty DG + undo entry) when it is still off
+                if not cmds.getAttr(shp + ".overrideEnabled"):
+                    cmds.setAttr(shp + ".overrideEnabled", 1)
             except Exception:
                 pass
 
@@ -28,19 +85,9 @@ def enable_color_override_on_selection():
 def apply_color_to_shapes(shapes, color_index):
     if not shapes:
         return
-    for shp in shapes:
-        try:
-            cmds.setAttr(shp + ".overrideEnabled", 1)
-            # use index color
-            cmds.setAttr(shp + ".overrideColor", int(color_index))
-            # disable rgb override if present
-            if cmds.attributeQuery("overrideRGBColors", node=shp, exists=True):
-                try:
-                    cmds.setAttr(shp + ".overrideRGBColors", 0)
-                except Exception:
-                    pass
-        except Exception as e:
-            cmds.warning("Failed to set color on {}: {}".format(shp, e))
+    with _color_edit_chunk("applyColor"):
+        # use index color, disable rgb override if present
+        _apply_index_color(shapes, color_index)
     cmds.select(shapes, r=True)
 
 
@@ -50,34 +97,12 @@ def apply_index_to_selection(color_index):
     if not sel:
         cmds.warning("Nothing selected.")
         return
-    for node in sel:
-        shapes = cmds.listRelatives(node, shapes=True, fullPath=True) or []
-        if shapes:
-            for shp in shapes:
-                if cmds.objectType(shp) == "nurbsCurve":
-                    try:
-                        cmds.setAttr(shp + ".overrideEnabled", 1)
-                        cmds.setAttr(shp + ".overrideColor", int(color_index))
-                        if cmds.attributeQuery("overrideRGBColors", node=shp, exists=True):
-                            try:
-                                cmds.setAttr(shp + ".overrideRGBColors", 0)
-                            except Exception:
-                                pass
-                    except Exception as e:
-                        cmds.warning("Failed on {}: {}".format(shp, e))
-        else:
-            # maybe a joint or transform
-            try:
-                if cmds.nodeType(node) == "joint" or cmds.attributeQuery("overrideColor", node=node, exists=True):
-                    cmds.setAttr(node + ".overrideEnabled", 1)
-                    cmds.setAttr(node + ".overrideColor", int(color_index))
-                    if cmds.attributeQuery("overrideRGBColors", node=node, exists=True):
-                        try:
-                            cmds.setAttr(node + ".overrideRGBColors", 0)
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+    shapes, shapeless = _split_selection(sel)
+    # only curve shapes get the index color; let ls do the type filtering
+    curves = (cmds.ls(shapes, type="nurbsCurve", long=True) or []) if shapes else []
+    targets = curves + shapeless
+    with _color_edit_chunk("applyIndexColor"):
+        _apply_index_color(targets, color_index)
 
 
 def apply_rgb_to_selection(rgb):
@@ -90,44 +115,46 @@ def apply_rgb_to_selection(rgb):
         cmds.warning("Nothing selected.")
         return
     r, g, b = rgb
-    for node in sel:
-        shapes = cmds.listRelatives(node, shapes=True, fullPath=True) or []
-        if shapes:
-            for shp in shapes:
-                try:
-                    cmds.setAttr(shp + ".overrideEnabled", 1)
-                    if cmds.attributeQuery("overrideRGBColors", node=shp, exists=True):
-                        cmds.setAttr(shp + ".overrideRGBColors", 1)
-                    # set double3 rgb attr if available
-                    if cmds.attributeQuery("overrideColorRGB", node=shp, exists=True):
-                        cmds.setAttr(shp + ".overrideColorRGB", float(r), float(g), float(b), type="double3")
-                    else:
-                        # fallback to index if rgb attrs not present
-                        cmds.warning("RGB override not available on {}; using nearest index instead.".format(shp))
-                except Exception as e:
-                    cmds.warning("Failed to set RGB on {}: {}".format(shp, e))
-        else:
-            # joints / transforms
+    shapes, shapeless = _split_selection(sel)
+    with _color_edit_chunk("applyRGBColor"):
+        has_rgb = _has_rgb_override((shapes or shapeless or sel)[0])
+        for shp in shapes:
             try:
-                if cmds.attributeQuery("overrideRGBColors", node=node, exists=True):
+                cmds.setAttr(shp + ".overrideEnabled", 1)
+                if has_rgb:
+                    cmds.setAttr(shp + ".overrideRGBColors", 1)
+                    cmds.setAttr(shp + ".overrideColorRGB", float(r), float(g), float(b), type="double3")
+                else:
+                    # fallback to index if rgb attrs not present
+                    cmds.warning("RGB override not available on {}; using nearest index instead.".format(shp))
+            except Exception as e:
+                cmds.warning("Failed to set RGB on {}: {}".format(shp, e))
+        # joints / transforms
+        if has_rgb:
+            for node in shapeless:
+                try:
                     cmds.setAttr(node + ".overrideEnabled", 1)
                     cmds.setAttr(node + ".overrideRGBColors", 1)
-                    if cmds.attributeQuery("overrideColorRGB", node=node, exists=True):
-                        cmds.setAttr(node + ".overrideColorRGB", float(r), float(g), float(b), type="double3")
-            except Exception:
-                pass
+                    cmds.setAttr(node + ".overrideColorRGB", float(r), float(g), float(b), type="double3")
+                except Exception:
+                    pass
 
 
 # UI
 def create_ui():
     if cmds.window(WINDOW, exists=True):
         cmds.deleteUI(WINDOW, window=True)
-    cmds.window(WINDOW, title="Color To Curve", widthHeight=(240, 120), sizeable=True)
-    cmds.columnLayout(adjustableColumn=True, rowSpacing=8)
+    # Hold viewport redraws until the override/color buttons are in place
+    cmds.refresh(suspend=True)
+    try:
+        cmds.window(WINDOW, title="Color To Curve", widthHeight=(240, 120), sizeable=True)
+        cmds.columnLayout(adjustableColumn=True, rowSpacing=8)
 
-    cmds.button(label="Enable Color Override (selection)", height=36, command=lambda *a: enable_color_override_on_selection())
-    cmds.separator(h=6, style='none')
-    cmds.button(label="Pick RGB and Apply", height=36, command=lambda *a: _open_color_editor_and_apply())
+        cmds.button(label="Enable Color Override (selection)", height=36, command=lambda *a: enable_color_override_on_selection())
+        cmds.separator(h=6, style='none')
+        cmds.button(label="Pick RGB and Apply", height=36, command=lambda *a: _open_color_editor_and_apply())
+    finally:
+        cmds.refresh(suspend=False)
 
     cmds.showWindow(WINDOW)
 
@@ -144,4 +171,5 @@ def _open_color_editor_and_apply():
         cmds.warning("Color editor failed: {}".format(e))
 
 
-create_ui()
\ No newline at end of file
+if __name__ == "__main__":
+    create_ui()
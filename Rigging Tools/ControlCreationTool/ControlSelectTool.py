@@ -1,15 +1,19 @@
+import re
+
 import maya.cmds as cmds
 
+CONTROL_PATTERN = re.compile(r'^_ctrl_(\d+)$')
+
 def selectControls():
-    selected_controls = []
-    i = 0
-    while True:
-        control_name = '_ctrl_{}'.format(i)
-        if not cmds.objExists(control_name):
-            break
-        selected_controls.append(control_name)
-        i += 1
-    cmds.select(selected_controls)
+    # One glob query instead of probing _ctrl_0, _ctrl_1, ... one at a time;
+    # keep only exact _ctrl_<n> names, in numeric order
+    matches = (CONTROL_PATTERN.match(name) for name in cmds.ls('_ctrl_*') or [])
+    indexed = sorted((int(m.group(1)), m.group(0)) for m in matches if m)
+    selected_controls = [name for _, name in indexed]
+    if selected_controls:
+        cmds.select(selected_controls, r=True)
+    else:
+        cmds.select(clear=True)
 
 def createUI():
     if cmds.window('controlSelectUI', exists=True):
@@ -17,7 +21,8 @@ def createUI():
 
     cmds.window('controlSelectUI', title='Control Select Tool', widthHeight=(200, 30), sizeable=False)
     cmds.columnLayout(adjustableColumn=True)
-    cmds.button(label='Select Controls', command='selectControls()')
+    cmds.button(label='Select Controls', command=lambda *_: selectControls())
     cmds.showWindow('controlSelectUI')
 
-createUI()
\ No newline at end of file
+if __name__ == "__main__":
+    createUI()
@@ -1,4 +1,5 @@
 import maya.cmds as cmds
+import maya.mel as mel
 
 def createLocator():
     cmds.spaceLocator()
@@ -8,9 +9,12 @@ def createJoint():
 
 def renameHand():
     sels = cmds.ls(sl=True)
-    for each in sels:
-        cmds.rename(each, '_Finger_0')
-        def createJointsAndRename(locators):
-            for i, locator in enumerate(locators):
-                joint = cmds.joint()
-                cmds.rename(joint, f'_Finger_{i}')
\ No newline at end of file
+    if not sels:
+        return
+    # One MEL eval for the whole selection; Maya still bumps the trailing digit on clashes
+    mel.eval("\n".join(f'rename "{each}" "_Finger_0";' for each in sels))
+
+def createJointsAndRename(locators):
+    for i, locator in enumerate(locators):
+        # each joint goes at its locator's world position, parented under the previous one
+        cmds.joint(name=f'_Finger_{i}', position=cmds.xform(locator, q=True, ws=True, t=True))
@@ -1,37 +1,69 @@
+import math
+
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
+from RigUtils import undo_chunk
 
 
+@undo_chunk
 def create_joints_at_clusters(match_rotation=False):
    
-    sel = cmds.ls(selection=True, long=True) or []
-    if not sel:
+    # Walk the active selection as API paths: parent and shape lookups are
+    # MDagPath steps instead of nodeType/listRelatives commands per node
+    sel_list = om.MGlobal.getActiveSelectionList()
+    if not sel_list.length():
         cmds.warning("Select one or more cluster handle transforms.")
         return []
 
-    created = []
-    for node in sel:
-        node_type = cmds.nodeType(node)
-        transform = node
+    targets = []
+    for i in range(sel_list.length()):
+        try:
+            dag = sel_list.getDagPath(i)
+        except TypeError:
+            node = om.MFnDependencyNode(sel_list.getDependNode(i)).name()
+            cmds.warning(f"Skipping '{node}': not a transform and no parent found.")
+            continue
 
-        if node_type != 'transform':
-            parents = cmds.listRelatives(node, parent=True, fullPath=True) or []
-            if not parents:
+        if dag.apiType() != om.MFn.kTransform:
+            node = dag.partialPathName()
+            dag.pop()
+            if not dag.length():
                 cmds.warning(f"Skipping '{node}': not a transform and no parent found.")
                 continue
-            transform = parents[0]
-
-        shapes = cmds.listRelatives(transform, shapes=True, fullPath=True) or []
-        if not any(cmds.nodeType(s) == 'clusterHandle' for s in shapes):
+        transform = dag.fullPathName()
+
+        has_cluster = False
+        for s in range(dag.numberOfShapesDirectlyBelow()):
+            shape = om.MDagPath(dag)
+            shape.extendToShape(s)
+            if om.MFnDependencyNode(shape.node()).typeName == 'clusterHandle':
+                has_cluster = True
+                break
+        if not has_cluster:
             cmds.warning(f"Skipping '{transform}': no cluster handle shape found.")
             continue
 
-        cmds.select(clear=True)
+        # the cluster's world rotate pivot is what matchTransform snapped to
+        pivot = om.MFnTransform(dag).rotatePivot(om.MSpace.kWorld)
+        rotation = None
+        if match_rotation:
+            euler = om.MTransformationMatrix(dag.inclusiveMatrix()).rotation()
+            rotation = [math.degrees(euler.x), math.degrees(euler.y), math.degrees(euler.z)]
+        targets.append((transform, (pivot.x, pivot.y, pivot.z), rotation))
+
+    # Creation stays on cmds so the whole batch is one undoable step
+    created = []
+    # locals for the per-cluster commands, so the loop skips the cmds attribute lookups
+    select, joint, xform = cmds.select, cmds.joint, cmds.xform
+    for transform, pos, rotation in targets:
+        select(clear=True)
         short = transform.split('|')[-1]
-        j = cmds.joint(name=f"{short}_Jnt")
-        cmds.matchTransform(j, transform, position=True, rotation=match_rotation)
+        j = joint(name=f"{short}_Jnt", position=pos)
+        if rotation:
+            xform(j, worldSpace=True, rotation=rotation)
         created.append(j)
-        
+
     return created
 
 
@@ -1,6 +1,8 @@
 import re
 import maya.cmds as cmds
 
+from RigUtils import no_eval, undo_chunk
+
 # Qt imports for Maya 2026: prefer PySide6, fallback to PySide2
 try:
 	from PySide6 import QtWidgets, QtCore
@@ -14,6 +16,12 @@ except Exception:
 		QtCore = None
 		shiboken = None
 
+# Name-parsing patterns, compiled once at import instead of looked up per call
+_TOKEN_SPLIT_RE = re.compile(r'[^A-Za-z0-9]+')
+_TRAILING_INDEX_RE = re.compile(r'(\d+)$')
+_UNSAFE_BASE_RE = re.compile(r'[^0-9A-Za-z_]')
+# Tokens dropped when deriving a chain's base name
+_GROUP_KEY_DROP = frozenset(['jnt', 'fk', 'ik', 'handle', 'cluster', 'h', 'ctl', 'ctrl', 'clav'])
 
 
 def _group_key_from_name(name):
@@ -23,8 +31,7 @@ def _group_key_from_name(name):
 	#  - remove numeric tokens and common suffix tokens
 	#  - keep tokens that identify fingers (Indx, Pnky, Thmb, Pntr, Mdl)
 	short = name.split('|')[-1]
-	parts = re.split(r'[^A-Za-z0-9]+', short)
-	remove = set(['jnt', 'fk', 'ik', 'handle', 'cluster', 'h', 'ctl', 'ctrl', 'clav'])
+	parts = _TOKEN_SPLIT_RE.split(short)
 	out_parts = []
 	for p in parts:
 		if not p:
@@ -32,7 +39,7 @@ def _group_key_from_name(name):
 		if p.isdigit():
 			continue
 		low = p.lower()
-		if low in remove:
+		if low in _GROUP_KEY_DROP:
 			continue
 		out_parts.append(p)
 
@@ -41,24 +48,18 @@ def _group_key_from_name(name):
 
 
 def _extract_index(name):
-	m = re.search(r'(\d+)$', name)
+	m = _TRAILING_INDEX_RE.search(name)
 	return int(m.group(1)) if m else None
 
 
 def _get_all_cluster_handle_transforms():
 	"""Return a list of transforms that contain a clusterHandle shape."""
 	shapes = cmds.ls(type='clusterHandle') or []
-	transforms = []
-	for sh in shapes:
-		parents = cmds.listRelatives(sh, parent=True, fullPath=True) or []
-		transforms.extend(parents)
-	seen = set()
-	out = []
-	for t in transforms:
-		if t not in seen:
-			seen.add(t)
-			out.append(t)
-	return out
+	if not shapes:
+		return []
+	# one listRelatives for every shape, de-duplicated in order
+	transforms = cmds.listRelatives(shapes, parent=True, fullPath=True) or []
+	return list(dict.fromkeys(transforms))
 
 
 def _find_matching_cluster_transform(target_name, base, idx, cluster_transforms):
@@ -104,6 +105,8 @@ def _find_matching_cluster_transform(target_name, base, idx, cluster_transforms)
 	return None
 
 
+@undo_chunk
+@no_eval
 def create_joints_from_selection(top_group_name='joints_from_clusters_grp'):
 	"""Create joints at selected cluster handles and parent into chains.
 
@@ -137,6 +140,10 @@ def create_joints_from_selection(top_group_name='joints_from_clusters_grp'):
 
 	created_roots = []
 
+	# the scene's cluster transforms don't change while joints are created,
+	# so collect them once rather than once per handle
+	cluster_transforms = _get_all_cluster_handle_transforms()
+
 	# Create a top group to hold all chains (avoid recreating if exists)
 	if cmds.objExists(top_group_name):
 		top_grp = top_group_name
@@ -148,7 +155,7 @@ def create_joints_from_selection(top_group_name='joints_from_clusters_grp'):
 		items.sort(key=lambda x: (x[1] if x[1] is not None else float('inf'), x[0]))
 
 		# create a group per chain
-		safe_base = re.sub(r'[^0-9A-Za-z_]', '_', base) or 'chain'
+		safe_base = _UNSAFE_BASE_RE.sub('_', base) or 'chain'
 		chain_grp = cmds.group(empty=True, name='{}_jnt_grp'.format(safe_base))
 		cmds.parent(chain_grp, top_grp)
 
@@ -159,13 +166,12 @@ def create_joints_from_selection(top_group_name='joints_from_clusters_grp'):
 			return n.split('|')[-1]
 
 		clav_items = [it for it in items if 'clav' in short(it[0]).lower()]
+		# items is already sorted, and filtering keeps that order
 		other_items = [it for it in items if 'clav' not in short(it[0]).lower()]
-		other_items.sort(key=lambda x: (x[1] if x[1] is not None else float('inf'), x[0]))
 		ordered = clav_items + other_items
 
 		for i, (h, idx) in enumerate(ordered):
 			# match an actual cluster transform in the scene when possible
-			cluster_transforms = _get_all_cluster_handle_transforms()
 			match = _find_matching_cluster_transform(h, base, idx, cluster_transforms)
 			if match:
 				pos = cmds.xform(match, q=True, ws=True, t=True)
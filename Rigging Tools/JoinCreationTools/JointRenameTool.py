@@ -1,35 +1,57 @@
 import maya.cmds as cmds
+import maya.mel as mel
+
+def _first_selected():
+    # One selection query per rename; long names so the node is unambiguous
+    selection = cmds.ls(selection=True, long=True)
+    if not selection:
+        cmds.warning("Select a joint or control to rename.")
+        return None
+    return selection[0]
+
+def _rename_selected(new_name):
+    # Whole selection in one MEL eval, numbered in selection order (L_jnt_00, L_jnt_01, ...).
+    # Short names only have to be unique among siblings, so a chain would otherwise
+    # end up with several nodes all called exactly new_name
+    selection = cmds.ls(selection=True, long=True)
+    if not selection:
+        cmds.warning("Select a joint or control to rename.")
+        return
+    renames = ['{}{:02d}'.format(new_name, i) for i in range(len(selection))]
+    # Deepest paths go first, since renaming a child never changes its parent's long name
+    order = sorted(zip(selection, renames), key=lambda pair: pair[0].count('|'), reverse=True)
+    cmds.undoInfo(openChunk=True)
+    try:
+        mel.eval("\n".join('rename "{}" "{}";'.format(node, name) for node, name in order))
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+def _prefix_first(prefix):
+    node = _first_selected()
+    if node:
+        new_name = cmds.rename(node, node.split('|')[-1].replace("_", prefix + "_"))
+        cmds.select(new_name)
 
 def renameLeftJoints(*args):
-    selection = cmds.ls(selection=True)
-    cmds.rename(selection[0], "L_jnt_")
+    _rename_selected("L_jnt_")
 
 def renameRightJoints(*args):
-    selection = cmds.ls(selection=True)
-    cmds.rename(selection[0], "R_jnt_")
+    _rename_selected("R_jnt_")
 
 def renameRightControls(*args):
-    selection = cmds.ls(selection=True)
-    cmds.rename(selection[0], "R_ctrl_")
+    _rename_selected("R_ctrl_")
 
 def renameLeftControls(*args):
-    selection = cmds.ls(selection=True)
-    cmds.rename(selection[0], "L_ctrl_")
+    _rename_selected("L_ctrl_")
 
 def renameFKJoints(*args):
-    selection = cmds.ls(selection=True)
-    new_name = cmds.rename(selection[0], cmds.ls(selection=True)[0].replace("_", "FK_"))
-    cmds.select(new_name)
+    _prefix_first("FK")
 
 def renameIKJoints(*args):
-    selection = cmds.ls(selection=True)
-    new_name = cmds.rename(selection[0], cmds.ls(selection=True)[0].replace("_", "IK_"))
-    cmds.select(new_name)
+    _prefix_first("IK")
 
 def renameRKJoints(*args):
-    selection = cmds.ls(selection=True)
-    new_name = cmds.rename(selection[0], cmds.ls(selection=True)[0].replace("_", "RK_"))
-    cmds.select(new_name)
+    _prefix_first("RK")
     
 
 
@@ -1,23 +1,72 @@
+import math
+
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
+from RigUtils import no_eval, undo_chunk
+
+
+# (prop node hash, attr name) -> MCallbackIds of the snap and pre-removal
+# callbacks set up for it. Kept across a module reload, so the live ids are
+# still there to remove; entries go when the prop is deleted or the scene changes
+try:
+    _FOLLOW_CALLBACKS
+except NameError:
+    _FOLLOW_CALLBACKS = {}
+
+
+def _remove_follow_callbacks(key):
+    for cb_id in _FOLLOW_CALLBACKS.pop(key, ()):
+        om.MMessage.removeCallback(cb_id)
+
+
+def _clear_follow_callbacks(*_):
+    for key in list(_FOLLOW_CALLBACKS):
+        _remove_follow_callbacks(key)
+
+
+# new / open scene drops every prop's callbacks; registered once per session
+try:
+    _SCENE_CALLBACKS
+except NameError:
+    _SCENE_CALLBACKS = [
+        om.MSceneMessage.addCallback(msg, _clear_follow_callbacks)
+        for msg in (om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen)
+    ]
+
+
+def _dag_path(name):
+    """Resolve name to an MDagPath through MSelectionList; None if nothing matches."""
+    sel = om.MSelectionList()
+    try:
+        sel.add(name)
+    except RuntimeError:
+        return None
+    return sel.getDagPath(0)
+
 
+@undo_chunk
+@no_eval
 def setup_prop_follow(prop_group, left_target, right_target, attr_name='followHand'):
     # -------------------------
     # Validation
     # -------------------------
+    # Resolve the inputs by name once; the paths are reused by the snap job below
+    paths = {}
     for obj, label in (
         (prop_group, "Prop group"),
         (left_target, "Left target"),
         (right_target, "Right target"),
     ):
-        if not cmds.objExists(obj):
+        paths[label] = _dag_path(obj)
+        if paths[label] is None:
             raise RuntimeError(f"{label} '{obj}' does not exist.")
 
     # -------------------------
     # Buffer group (NO movement)
     # -------------------------
     buffer_grp = f"{prop_group}_followBuffer"
-    if not cmds.objExists(buffer_grp):
+    if _dag_path(buffer_grp) is None:
         buffer_grp = cmds.group(empty=True, name=buffer_grp)
         cmds.delete(cmds.parentConstraint(prop_group, buffer_grp))
         parent = cmds.listRelatives(prop_group, parent=True)
@@ -39,25 +88,19 @@ def setup_prop_follow(prop_group, left_target, right_target, attr_name='followHa
         cmds.setAttr(f"{prop_group}.{attr_name}", 0)
 
     # -------------------------
-    # Constraints on buffer
+    # Constraint on buffer (one node, both hands as targets: W0 = left, W1 = right)
     # -------------------------
-    constr_left = cmds.parentConstraint(
-        left_target, buffer_grp, mo=False,
-        name=f"{prop_group}_follow_left_parentConstraint"
-    )[0]
-
-    constr_right = cmds.parentConstraint(
-        right_target, buffer_grp, mo=False,
-        name=f"{prop_group}_follow_right_parentConstraint"
+    constr = cmds.parentConstraint(
+        left_target, right_target, buffer_grp, mo=False,
+        name=f"{prop_group}_follow_parentConstraint"
     )[0]
 
     # Force weights
-    cmds.setAttr(constr_left + ".target[0].targetWeight", 1)
-    cmds.setAttr(constr_right + ".target[0].targetWeight", 1)
+    cmds.setAttr(constr + ".target[0].targetWeight", 1)
+    cmds.setAttr(constr + ".target[1].targetWeight", 1)
 
     # Disable initially
-    cmds.setAttr(constr_left + ".enable", 0)
-    cmds.setAttr(constr_right + ".enable", 0)
+    cmds.setAttr(constr + ".enable", 0)
 
     # -------------------------
     # Condition nodes to drive target weights
@@ -77,26 +120,62 @@ def setup_prop_follow(prop_group, left_target, right_target, attr_name='followHa
         )
 
     # Connect condition outputs to constraint target weights (not enable)
-    cmds.connectAttr(cond_left + ".outColorR", constr_left + ".target[0].targetWeight", force=True)
-    cmds.connectAttr(cond_right + ".outColorR", constr_right + ".target[0].targetWeight", force=True)
+    cmds.connectAttr(cond_left + ".outColorR", constr + ".target[0].targetWeight", force=True)
+    cmds.connectAttr(cond_right + ".outColorR", constr + ".target[1].targetWeight", force=True)
 
     # -------------------------
-    # Force SNAP on enum change using matchTransform
+    # Force SNAP on enum change
     # -------------------------
+    # Resolve the nodes and the enum plug once; the callback then reads the
+    # hand's world matrix through the API instead of getAttr + matchTransform
+    # on every switch (the buffer is resolved only now, after it has been
+    # created/reparented; the prop's node handle survives being reparented under it)
+    target_paths = {1: paths["Left target"], 2: paths["Right target"]}
+    buffer_fn = om.MFnTransform(_dag_path(buffer_grp))
+    follow_plug = om.MFnDependencyNode(paths["Prop group"].node()).findPlug(attr_name, False)
+
     def snap_on_switch():
-        val = cmds.getAttr(f"{prop_group}.{attr_name}")
-        if val == 1:
-            cmds.matchTransform(buffer_grp, left_target, pos=True, rot=True)
-        elif val == 2:
-            cmds.matchTransform(buffer_grp, right_target, pos=True, rot=True)
-        # val == 0 (Off): leave buffer_grp where it is
-
-    cmds.scriptJob(
-        attributeChange=[f"{prop_group}.{attr_name}", snap_on_switch],
-        protected=True
+        val = follow_plug.asInt()
+        if val not in target_paths:
+            # val == 0 (Off): leave buffer_grp where it is
+            return
+        # hand's world pose, rotation expressed in the buffer's own rotate order
+        xfm = om.MTransformationMatrix(target_paths[val].inclusiveMatrix())
+        xfm.reorderRotation(buffer_fn.rotationOrder())
+        pos = xfm.translation(om.MSpace.kWorld)
+        rot = xfm.rotation()
+        # written with one cmds.xform, not MFnTransform, so the snap is undoable
+        cmds.xform(
+            buffer_fn.fullPathName(), ws=True,
+            t=(pos.x, pos.y, pos.z),
+            ro=(math.degrees(rot.x), math.degrees(rot.y), math.degrees(rot.z))
+        )
+
+    # Node-level attribute callback instead of a scriptJob: the filtering below
+    # runs per edit on this node only, and re-running the setup replaces the
+    # old callback rather than stacking another job on the same prop
+    prop_node = paths["Prop group"].node()
+
+    def on_attr_changed(msg, plug, other_plug, client_data):
+        if not msg & om.MNodeMessage.kAttributeSet or plug != follow_plug:
+            return
+        # snap once the edit has finished, as the scriptJob did
+        cmds.evalDeferred(snap_on_switch)
+
+    handle = om.MObjectHandle(prop_node)
+    key = (handle.hashCode(), attr_name)
+    _remove_follow_callbacks(key)
+
+    def on_prop_removed(node, modifier, client_data):
+        # the hash can be handed to a new node once this one is gone
+        _remove_follow_callbacks(key)
+
+    _FOLLOW_CALLBACKS[key] = (
+        om.MNodeMessage.addAttributeChangedCallback(prop_node, on_attr_changed),
+        om.MNodeMessage.addNodePreRemovalCallback(prop_node, on_prop_removed),
     )
 
-    return constr_left, constr_right
+    return constr
 
 
 # --------------------------------------------------------------------
@@ -0,0 +1,36 @@
+"""RigUtils
+
+Shared helpers for the joint builders in this folder (SplineTool, PropFollowTool,
+JointGroupTool, JoinCreateTool).
+
+The builders import it by plain module name, so it has to stay next to them.
+"""
+
+import functools
+
+import maya.cmds as cmds
+
+
+def undo_chunk(fn):
+    """Decorator: run fn as a single undo step named after it."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        cmds.undoInfo(openChunk=True, chunkName=fn.__name__)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+    return wrapper
+
+
+def no_eval(fn):
+    """Decorator: run fn with the evaluation manager off, restoring the previous mode."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        prev_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        cmds.evaluationManager(mode='off')
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            cmds.evaluationManager(mode=prev_mode)
+    return wrapper
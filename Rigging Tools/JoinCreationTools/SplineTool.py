@@ -9,64 +9,87 @@ Usage:
 - Select root joint(s) and press "Create Curve + Controls"
 - Options: control size, maintain offset
 """
+import contextlib
+
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
+import maya.mel as mel
+
+from RigUtils import no_eval, undo_chunk
 
 WIN = "splineIKTool_win"
 
+@contextlib.contextmanager
+def _suspended_refresh():
+    """Hold viewport redraws while several builder steps run, then redraw once."""
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.refresh()
+
+
+def _is_joint(name):
+    return cmds.objExists(name) and cmds.nodeType(name) == 'joint'
+
 def get_joint_chain(root):
     """Return joints in chain top-down starting at root (fullPath names)."""
     chain = []
-    def _walk(j):
-        chain.append(j)
-        children = cmds.listRelatives(j, children=True, type='joint', fullPath=True) or []
-        for c in children:
-            _walk(c)
-    if cmds.objExists(root) and cmds.nodeType(root) == 'joint':
-        _walk(root)
+    if not _is_joint(root):
+        return chain
+    sel = om.MSelectionList()
+    sel.add(root)
+    # depth-first walk in C++; pruning at non-joints keeps it to joint-under-joint
+    # children, same as listRelatives(type='joint') at each level
+    it = om.MItDag(om.MItDag.kDepthFirst)
+    it.reset(sel.getDagPath(0), om.MItDag.kDepthFirst)
+    while not it.isDone():
+        if it.currentItem().hasFn(om.MFn.kJoint):
+            chain.append(it.fullPathName())
+        else:
+            it.prune()
+        it.next()
     return chain
 
 def create_curve_from_joints(joints, name="splineCurve", degree=3):
     """Create a nurbs curve through joint world positions. Returns curve transform."""
     if not joints:
         return None
-    pts = []
+    # read every world position in one API sweep: the translation row
+    # (flat elements 12..14) of each joint's inclusive (world) matrix, no xform call per joint
+    sel = om.MSelectionList()
     for j in joints:
-        pts.append(cmds.xform(j, q=True, ws=True, t=True))
-    # if only 2 points, degree must be 1
-    deg = degree
-    if len(pts) < 3:
-        deg = 1
-    curve = cmds.curve(p=pts, degree=deg, name=name)
-    # rebuild to have nice parameterization (optional)
-    try:
-        spans = max(1, len(pts)-1)
-        cmds.rebuildCurve(curve, s=(spans), d=deg, replaceOriginal=True)
-    except Exception:
-        pass
+        sel.add(j)
+    get_path = sel.getDagPath
+    pts = [tuple(get_path(i).inclusiveMatrix())[12:15] for i in range(sel.length())]
+    # degree can't exceed the point count - 1 (2 points -> linear)
+    deg = max(1, min(degree, len(pts) - 1))
+    # clamped uniform knots (integer parameter range 0..spans) go in with the
+    # points, so the curve is built once instead of created and then rebuilt
+    spans = len(pts) - deg
+    knots = [0] * (deg - 1) + list(range(spans + 1)) + [spans] * (deg - 1)
+    curve = cmds.curve(p=pts, degree=deg, knot=knots, name=name)
     return curve
 
 def create_ctrl(name, pos, size=1.0, parent=None):
-    """Create a simple circle control at pos (world) and return its transform."""
+    """Create a simple circle control at pos (world) and return (ctrl, group) full paths."""
+    # circle stays at the origin with zeroed channels, so no freeze is needed;
+    # the group is created around it (under parent, if given) and moved instead.
+    # It keeps its unique default nurbsCircleN name until grouped and is then
+    # renamed by full path, since name can match the joint or an earlier control
     ctrl_circle = cmds.circle(normal=[0,1,0], radius=size, ch=False)[0]
-    # freeze transforms on shape parent, move transform then center pivot
-    cmds.xform(ctrl_circle, ws=True, t=pos)
-    cmds.makeIdentity(ctrl_circle, apply=True, t=1, r=1, s=1, n=0)
-    grp = cmds.group(ctrl_circle, name=name + "_GRP")
-    # zero group at control for easier offset handling
-    # Move group to same position and parent control under it
-    cmds.xform(grp, ws=True, t=pos)
-    # unparent control from group (circle created as child of transform) then parent properly:
-    # Actually circle returns transform; ensure correct parenting:
-    try:
-        # place ctrl under group (if not already)
-        if cmds.listRelatives(ctrl_circle, parent=True) != [grp]:
-            cmds.parent(ctrl_circle, grp)
-    except Exception:
-        pass
     if parent:
-        cmds.parent(grp, parent)
-    return ctrl_circle, grp
+        cmds.group(ctrl_circle, name=name + "_GRP", parent=parent)
+    else:
+        cmds.group(ctrl_circle, name=name + "_GRP")
+    grp = cmds.listRelatives(ctrl_circle, parent=True, fullPath=True)[0]
+    ctrl = grp + "|" + cmds.rename(grp + "|" + ctrl_circle, name).split('|')[-1]
+    cmds.xform(grp, ws=True, t=pos)
+    return ctrl, grp
 
+@undo_chunk
+@no_eval
 def attach_ctrls_to_curve(curve, joint_chain, ctrl_size=1.0, maintain_offset=True):
     """
     For each joint in joint_chain create:
@@ -94,50 +117,65 @@ def attach_ctrls_to_curve(curve, joint_chain, ctrl_size=1.0, maintain_offset=Tru
 
     parent_grp = cmds.group(empty=True, name=curve + "_ctrls_GRP")
 
+    # control positions are sampled straight off the shape through the API
+    shape_sel = om.MSelectionList()
+    shape_sel.add(curve_shape)
+    curve_fn = om.MFnNurbsCurve(shape_sel.getDagPath(0))
+
     created = []
+    # per-joint wiring is queued here and sent to MEL in one eval after the loop;
+    # catch() keeps the old per-joint fallbacks without aborting the whole batch
+    wiring = []
+    mo = int(bool(maintain_offset))
+    # bind what the loop calls every iteration to locals (LOAD_FAST, no attribute lookups)
+    _create = cmds.createNode
+    _xform = cmds.xform
+    _point_at = curve_fn.getPointAtParam
+    _queue = wiring.append
+    world = om.MSpace.kWorld
     n = len(joint_chain)
     for idx, j in enumerate(joint_chain):
         t = 0.0 if n == 1 else float(idx) / float(n - 1)  # normalized 0..1
         param = t * spans
 
         # create pointOnCurveInfo node
-        poci = cmds.createNode('pointOnCurveInfo', name="poci_{}_{}".format(j.split('|')[-1], idx))
-        cmds.connectAttr(curve_shape + ".worldSpace[0]", poci + ".inputCurve", f=True)
-        cmds.setAttr(poci + ".parameter", float(param))
+        poci = _create('pointOnCurveInfo', name="poci_{}_{}".format(j.split('|')[-1], idx))
+        _queue('connectAttr -f "{}.worldSpace[0]" "{}.inputCurve";'.format(curve_shape, poci))
+        _queue('setAttr "{}.parameter" {};'.format(poci, float(param)))
 
         # create control and group (control transform will be parented under grp)
-        pos = cmds.pointOnCurve(curve, pr=True, position=True, parameter=param) if cmds.objExists(curve) else cmds.xform(j, q=True, ws=True, t=True)
-        # fallback if pointOnCurve didn't return point
-        if not pos:
-            pos = cmds.xform(j, q=True, ws=True, t=True)
+        try:
+            pt = _point_at(param, world)
+            pos = [pt.x, pt.y, pt.z]
+        except RuntimeError:
+            # fallback if the parameter falls outside the curve's range
+            pos = _xform(j, q=True, ws=True, t=True)
 
         ctrl_name = j.split('|')[-1].replace("_Jnt", "_Ctrl")
         ctrl, ctrl_grp = create_ctrl(ctrl_name, pos, size=ctrl_size, parent=parent_grp)
 
         # connect poci.position -> ctrl_grp.translate so group follows curve (control remains oriented)
-        try:
-            cmds.connectAttr(poci + ".position", ctrl_grp + ".translate", f=True)
-        except Exception:
-            # fallback: set translation explicitly (static)
-            cmds.xform(ctrl_grp, ws=True, t=pos)
+        # fallback: set translation explicitly (static)
+        _queue('if (catch(`connectAttr -f "{0}.position" "{1}.translate"`)) xform -ws -t {2} {3} {4} "{1}";'.format(
+            poci, ctrl_grp, pos[0], pos[1], pos[2]))
 
         # optionally orient the control to the curve tangent using poci.tangent
         # create aim-group to orient control: connect poci.tangent to an aim node would be more work.
         # Instead we place a second helper that is parented and aimConstrained if needed (left as extension)
 
         # constrain joint to ctrl (parent constraint keeps both transl+rot)
-        try:
-            cmds.parentConstraint(ctrl, j, mo=maintain_offset, name="pc_{}_to_{}".format(ctrl.split('|')[-1], j.split('|')[-1]))
-        except Exception:
-            # fallback to point + orient if parent fails
-            try:
-                cmds.pointConstraint(ctrl, j, mo=maintain_offset)
-                cmds.orientConstraint(ctrl, j, mo=maintain_offset)
-            except Exception:
-                cmds.warning("Failed to constrain {} to {}".format(j, ctrl))
+        # fallback to point + orient if parent fails
+        _queue(
+            'if (catch(`parentConstraint -mo {mo} -n "pc_{cs}_to_{js}" "{c}" "{j}"`)) {{'
+            ' if (catch(`pointConstraint -mo {mo} "{c}" "{j}"`) || catch(`orientConstraint -mo {mo} "{c}" "{j}"`))'
+            ' warning "Failed to constrain {j} to {c}"; }}'.format(
+                mo=mo, c=ctrl, j=j, cs=ctrl.split('|')[-1], js=j.split('|')[-1]))
 
         created.append((j, ctrl, ctrl_grp, poci))
 
+    if wiring:
+        mel.eval("\n".join(wiring))
+
     cmds.select(parent_grp, r=True)
     return created
 
@@ -167,6 +205,7 @@ def build_ui():
     cmds.button(label="Close", height=26, command=lambda *a: cmds.deleteUI(WIN))
     cmds.showWindow(WIN)
 
+@no_eval
 def ui_create_curve_controls():
     sels = cmds.ls(selection=True, long=True) or []
     if not sels:
@@ -175,17 +214,19 @@ def ui_create_curve_controls():
     all_created = []
     size = cmds.floatSliderGrp('ctrlSize', q=True, value=True)
     mo = cmds.checkBox('maintainOffset', q=True, v=True)
-    for root in sels:
-        if cmds.nodeType(root) != 'joint':
-            cmds.warning("{} is not a joint, skipping.".format(root))
-            continue
-        chain = get_joint_chain(root)
-        if not chain:
-            continue
-        curve_name = cmds.ls(root + "_splineCurve", long=False) and root + "_splineCurve" or root.split('|')[-1] + "_splineCurve"
-        curve = create_curve_from_joints(chain, name=curve_name)
-        created = attach_ctrls_to_curve(curve, chain, ctrl_size=size, maintain_offset=mo)
-        all_created.extend(created)
+    with _suspended_refresh():
+        for root in sels:
+            if not _is_joint(root):
+                cmds.warning("{} is not a joint, skipping.".format(root))
+                continue
+            chain = get_joint_chain(root)
+            if not chain:
+                continue
+            # both branches of the old ls() probe ended up naming the curve after the short name
+            curve_name = root.rsplit('|', 1)[-1] + "_splineCurve"
+            curve = create_curve_from_joints(chain, name=curve_name)
+            created = attach_ctrls_to_curve(curve, chain, ctrl_size=size, maintain_offset=mo)
+            all_created.extend(created)
     if all_created:
         cmds.inViewMessage(amg="Spline IK Controls created.", pos='topCenter', fade=True)
     else:
@@ -199,14 +240,24 @@ def ui_attach_curve_controls():
     # assume first selected is curve and second is joint root
     curve = None
     root = None
+    # classify the selection through the API: the first shape under a plain
+    # transform tells curves apart, instead of objectType/listRelatives/nodeType per item
+    sel = om.MSelectionList()
     for s in sels:
-        if cmds.objectType(s) in ('transform',) and cmds.listRelatives(s, shapes=True):
-            shp = cmds.listRelatives(s, shapes=True, fullPath=True)[0]
-            if cmds.nodeType(shp) == 'nurbsCurve' and not curve:
-                curve = s
+        sel.add(s)
+    for i in range(sel.length()):
+        try:
+            dp = sel.getDagPath(i)
+        except TypeError:
+            continue  # not a DAG node
+        if not curve and dp.apiType() == om.MFn.kTransform and dp.numberOfShapesDirectlyBelow():
+            shape = om.MDagPath(dp)
+            shape.extendToShape(0)
+            if shape.apiType() == om.MFn.kNurbsCurve:
+                curve = dp.fullPathName()
                 continue
-        if cmds.nodeType(s) == 'joint' and not root:
-            root = s
+        if not root and dp.apiType() == om.MFn.kJoint:
+            root = dp.fullPathName()
     if not curve or not root:
         cmds.warning("Couldn't detect curve + joint root in selection. Select curve then joint root.")
         return
@@ -216,34 +267,40 @@ def ui_attach_curve_controls():
     attach_ctrls_to_curve(curve, chain, ctrl_size=size, maintain_offset=mo)
     cmds.inViewMessage(amg="Attached controls to curve.", pos='topCenter', fade=True)
 
+@undo_chunk
 def ui_create_ik_spline_handle():
     sels = cmds.ls(selection=True, long=True) or []
     if not sels:
         cmds.warning("Select joint root to create IK spline handle for its chain.")
         return
-    for root in sels:
-        if cmds.nodeType(root) != 'joint':
-            continue
-        chain = get_joint_chain(root)
-        if len(chain) < 2:
-            cmds.warning("Need at least 2 joints for an IK spline.")
-            continue
-        start = chain[0]
-        end = chain[-1]
-        curve_name = root.split('|')[-1] + "_splineCurve"
-        # try to use existing curve if found, else create one
-        curve = None
-        if cmds.objExists(curve_name):
-            curve = curve_name
-        else:
-            curve = create_curve_from_joints(chain, name=curve_name)
-        try:
-            handle = cmds.ikHandle(startJoint=start, endEffector=end, sol="ikSplineSolver", name=root.split('|')[-1] + "_ikSplineHandle", curve=curve, createCurve=False)[0]
-            # optionally parent handle under a group for neatness
-            grp = cmds.group(handle, name=handle + "_GRP")
-            cmds.inViewMessage(amg="IK Spline handle created.", pos='topCenter', fade=True)
-        except Exception as e:
-            cmds.warning("Failed to create ikSpline: {}".format(e))
+    # one redraw and one message for the whole selection, not one per root
+    handles = []
+    with _suspended_refresh():
+        for root in sels:
+            if not _is_joint(root):
+                continue
+            chain = get_joint_chain(root)
+            if len(chain) < 2:
+                cmds.warning("Need at least 2 joints for an IK spline.")
+                continue
+            start = chain[0]
+            end = chain[-1]
+            curve_name = root.split('|')[-1] + "_splineCurve"
+            # try to use existing curve if found, else create one
+            curve = None
+            if cmds.objExists(curve_name):
+                curve = curve_name
+            else:
+                curve = create_curve_from_joints(chain, name=curve_name)
+            try:
+                handle = cmds.ikHandle(startJoint=start, endEffector=end, sol="ikSplineSolver", name=root.split('|')[-1] + "_ikSplineHandle", curve=curve, createCurve=False)[0]
+                # optionally parent handle under a group for neatness
+                grp = cmds.group(handle, name=handle + "_GRP")
+                handles.append(handle)
+            except Exception as e:
+                cmds.warning("Failed to create ikSpline: {}".format(e))
+    if handles:
+        cmds.inViewMessage(amg="IK Spline handle created.", pos='topCenter', fade=True)
 
 if __name__ == "__main__":
     build_ui()
\ No newline at end of file
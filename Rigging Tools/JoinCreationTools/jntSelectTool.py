@@ -1,26 +1,38 @@
 import maya.cmds as cmds
+import maya.mel as mel
+
+def _select_pattern(pattern):
+    # Hand the wildcard straight to select, which resolves it itself, instead
+    # of ls building a name list that select re-resolves; staying on cmds.select
+    # keeps the selection change on the undo queue
+    try:
+        cmds.select(pattern, replace=True)
+    except ValueError:
+        cmds.select(clear=True)  # nothing matches: select nothing, as before
 
 def selectRight():
-    selected_joints_Right = cmds.ls('*R_*')
-    cmds.select(selected_joints_Right)
+    _select_pattern('*R_*')
 
 def selectLeft():
-    selected_joints_Left = cmds.ls('*L_*')
-    cmds.select(selected_joints_Left)
+    _select_pattern('*L_*')
     
 
 def selectGeo():
-    selected_geo = cmds.ls('*_Geo')
-    cmds.select(selected_geo)
+    _select_pattern('*_Geo')
 
 def orientJoints():
-    selectJoints = cmds.ls(selection=True)
-    for jnt in selectJoints:
-        cmds.select(jnt)
-        cmds.setAttr('{}.rx'.format(jnt), 0)
-        cmds.setAttr('{}.ry'.format(jnt), 0)
-        cmds.setAttr('{}.rz'.format(jnt), 0)
-    cmds.joint(e=True, oj='xyz', ch=True, zso=True)
+    selectJoints = cmds.ls(selection=True, type='joint')
+    if not selectJoints:
+        return
+    cmds.undoInfo(openChunk=True)
+    try:
+        # zero every joint's rotates in a single MEL eval
+        mel.eval(''.join('setAttr "{}.rotate" 0 0 0;'.format(jnt) for jnt in selectJoints))
+        # joint -e takes the joint directly, so the selection isn't touched per joint
+        for jnt in selectJoints:
+            cmds.joint(jnt, e=True, oj='xyz', ch=True, zso=True)
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
 def deleteSelected():
     cmds.delete(cmds.ls(selection=True))
@@ -31,11 +43,11 @@ def createUI():
 
     cmds.window('jntSelectUI', title='Joint Select Tool', widthHeight=(200, 30), sizeable=False)
     cmds.columnLayout(adjustableColumn=True)
-    cmds.button(label='Select Right', command='selectRight()') 
-    cmds.button(label='Select Left', command='selectLeft()')
-    cmds.button(label='Select All Geo', command='selectGeo()')
-    cmds.button(label='Delete Selected', command='cmds.delete()')
-    cmds.button(label='Orient Joints', command='orientJoints()')
+    cmds.button(label='Select Right', command=lambda *a: selectRight()) 
+    cmds.button(label='Select Left', command=lambda *a: selectLeft())
+    cmds.button(label='Select All Geo', command=lambda *a: selectGeo())
+    cmds.button(label='Delete Selected', command=lambda *a: cmds.delete())
+    cmds.button(label='Orient Joints', command=lambda *a: orientJoints())
     cmds.showWindow('jntSelectUI')
     
 
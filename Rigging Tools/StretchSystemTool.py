@@ -17,12 +17,14 @@ The module will print the node creation plan when not run inside Maya (dry-run m
 """
 
 from __future__ import annotations
-import math
+import functools
 import logging
 logger = logging.getLogger(__name__)
 
 try:
+    import maya.api.OpenMaya as om
     import maya.cmds as cmds
+    import maya.mel as mel
     IN_MAYA = True
 except Exception:
     IN_MAYA = False
@@ -38,6 +40,21 @@ def _maya(cmd, *args, **kwargs):
         return None
 
 
+def _undo_chunk(fn):
+    """Run fn as a single undo step named after it (plain call in dry-run mode)."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not IN_MAYA:
+            return fn(*args, **kwargs)
+        cmds.undoInfo(openChunk=True, chunkName=fn.__name__)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+    return wrapper
+
+
+@_undo_chunk
 def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jnt: str, *, name: str = None, clamp_min: bool = True, add_attr: bool = True):
     """Create a node-based stretch system for a two-segment IK chain.
 
@@ -69,6 +86,9 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
                 ik_transform = shapes[0]
 
     created = {}
+    # connectAttr/setAttr wiring between the nodes is queued here and sent to MEL
+    # in one eval once every node exists, instead of one command per plug
+    wiring = []
 
     # create locators and position them at joints
     loc_start = f"{name}_loc_start_loc"
@@ -92,25 +112,27 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
         if not cmds.objExists(dist_node):
             dist_node = cmds.createNode('distanceBetween', name=dist_node)
         # connect locator worldMatrix to distance node
-        cmds.connectAttr(f"{loc_start}.worldMatrix[0]", f"{dist_node}.inMatrix1", force=True)
-        cmds.connectAttr(f"{loc_end}.worldMatrix[0]", f"{dist_node}.inMatrix2", force=True)
-        current_dist = cmds.getAttr(f"{dist_node}.distance")
+        wiring.append(f'connectAttr -f "{loc_start}.worldMatrix[0]" "{dist_node}.inMatrix1";')
+        wiring.append(f'connectAttr -f "{loc_end}.worldMatrix[0]" "{dist_node}.inMatrix2";')
     else:
         _maya('createNode', 'distanceBetween', name=dist_node)
-        current_dist = None
     created['distance'] = dist_node
 
     # compute rest lengths of segments (vector distance between start->mid and mid->end)
-    def _segment_length(a, b):
-        if IN_MAYA:
-            pa = cmds.xform(a, q=True, ws=True, t=True)
-            pb = cmds.xform(b, q=True, ws=True, t=True)
-            return math.dist(pa, pb)
-        else:
-            return 1.0
-
-    len1 = _segment_length(start_jnt, mid_jnt)
-    len2 = _segment_length(mid_jnt, end_jnt)
+    if IN_MAYA:
+        # one MSelectionList for the three joints; each world position is read
+        # off its inclusive matrix once instead of two xform queries per segment
+        sel = om.MSelectionList()
+        for jnt in (start_jnt, mid_jnt, end_jnt):
+            sel.add(jnt)
+        p_start, p_mid, p_end = (
+            om.MTransformationMatrix(sel.getDagPath(i).inclusiveMatrix()).translation(om.MSpace.kWorld)
+            for i in range(3)
+        )
+        len1 = (p_mid - p_start).length()
+        len2 = (p_end - p_mid).length()
+    else:
+        len1 = len2 = 1.0
     rest_length = len1 + len2
 
     # multiplyDivide node to compute scale factor = currentDist / rest_length
@@ -118,9 +140,9 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
     if IN_MAYA:
         if not cmds.objExists(md_node):
             md_node = cmds.createNode('multiplyDivide', name=md_node)
-        cmds.setAttr(f"{md_node}.operation", 2)  # divide
-        cmds.connectAttr(f"{dist_node}.distance", f"{md_node}.input1X", force=True)
-        cmds.setAttr(f"{md_node}.input2X", rest_length)
+        wiring.append(f'setAttr "{md_node}.operation" 2;')  # divide
+        wiring.append(f'connectAttr -f "{dist_node}.distance" "{md_node}.input1X";')
+        wiring.append(f'setAttr "{md_node}.input2X" {rest_length!r};')
     else:
         _maya('createNode', 'multiplyDivide', name=md_node)
     created['md_divide'] = md_node
@@ -131,12 +153,12 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
         if not cmds.objExists(cond_node):
             cond_node = cmds.createNode('condition', name=cond_node)
         # Compare md.outputX to 1.0
-        cmds.connectAttr(f"{md_node}.outputX", f"{cond_node}.firstTerm", force=True)
-        cmds.setAttr(f"{cond_node}.secondTerm", 1.0)
-        cmds.setAttr(f"{cond_node}.operation", 2)  # Greater
+        wiring.append(f'connectAttr -f "{md_node}.outputX" "{cond_node}.firstTerm";')
+        wiring.append(f'setAttr "{cond_node}.secondTerm" 1.0;')
+        wiring.append(f'setAttr "{cond_node}.operation" 2;')  # Greater
         # If greater: use md.outputX, else: 1.0
-        cmds.connectAttr(f"{md_node}.outputX", f"{cond_node}.colorIfTrueR", force=True)
-        cmds.setAttr(f"{cond_node}.colorIfFalseR", 1.0)
+        wiring.append(f'connectAttr -f "{md_node}.outputX" "{cond_node}.colorIfTrueR";')
+        wiring.append(f'setAttr "{cond_node}.colorIfFalseR" 1.0;')
         out_attr = f"{cond_node}.outColorR"
     else:
         _maya('createNode', 'condition', name=cond_node)
@@ -149,8 +171,8 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
         if not cmds.objExists(blend_node):
             blend_node = cmds.createNode('blendColors', name=blend_node)
         # color1 = 1 (no stretch), color2 = condition result
-        cmds.setAttr(f"{blend_node}.color1R", 1.0)
-        cmds.connectAttr(out_attr, f"{blend_node}.color2R", force=True)
+        wiring.append(f'setAttr "{blend_node}.color1R" 1.0;')
+        wiring.append(f'connectAttr -f "{out_attr}" "{blend_node}.color2R";')
     else:
         _maya('createNode', 'blendColors', name=blend_node)
     created['blend'] = blend_node
@@ -159,10 +181,9 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
     stretch_attr = f"{ik_transform}.stretch"
     if IN_MAYA and add_attr:
         if not cmds.attributeQuery('stretch', node=ik_transform, exists=True):
-            cmds.addAttr(ik_transform, longName='stretch', attributeType='double', min=0.0, max=1.0, defaultValue=1.0)
-            cmds.setAttr(f"{ik_transform}.stretch", keyable=True)
+            cmds.addAttr(ik_transform, longName='stretch', attributeType='double', min=0.0, max=1.0, defaultValue=1.0, keyable=True)
         # connect attribute to blend
-        cmds.connectAttr(f"{ik_transform}.stretch", f"{blend_node}.blender", force=True)
+        wiring.append(f'connectAttr -f "{ik_transform}.stretch" "{blend_node}.blender";')
     else:
         if not IN_MAYA:
             print(f"DRY RUN: create attr {stretch_attr} and connect to {blend_node}.blender")
@@ -172,8 +193,9 @@ def create_stretch_ik_chain(ik_handle: str, start_jnt: str, mid_jnt: str, end_jn
     # Note: some rigs expect scaleY/scaleZ driven or joint scale compensation — this keeps it simple.
     if IN_MAYA:
         # connect blend.outputR -> start_jnt.scaleX and mid_jnt.scaleX
-        cmds.connectAttr(f"{blend_node}.outputR", f"{start_jnt}.scaleX", force=True)
-        cmds.connectAttr(f"{blend_node}.outputR", f"{mid_jnt}.scaleX", force=True)
+        wiring.append(f'connectAttr -f "{blend_node}.outputR" "{start_jnt}.scaleX";')
+        wiring.append(f'connectAttr -f "{blend_node}.outputR" "{mid_jnt}.scaleX";')
+        mel.eval("\n".join(wiring))
     else:
         _maya('connectAttr', f"{blend_node}.outputR", f"{start_jnt}.scaleX")
         _maya('connectAttr', f"{blend_node}.outputR", f"{mid_jnt}.scaleX")
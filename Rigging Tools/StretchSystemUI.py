@@ -24,9 +24,23 @@ except Exception:
 
 from functools import partial
 
+try:
+    from StretchSystemTool import create_stretch_ik_chain as _create_stretch
+except ImportError:
+    _create_stretch = None
+
+
+# first four selected names, refreshed by a SelectionChanged scriptJob while the
+# window is open, so the "From Sel"/"Create From Selection" buttons don't re-list
+_SEL_CACHE = {'sel': []}
+
+
+def _update_sel_cache():
+    _SEL_CACHE['sel'] = (cmds.ls(selection=True) or [])[:4]
+
 
 def _set_field_from_selection(field):
-    sel = cmds.ls(selection=True) or []
+    sel = _SEL_CACHE['sel']
     if not sel:
         cmds.warning('Select an object first to populate the field.')
         return
@@ -46,16 +60,14 @@ def _create_from_fields(start_f, mid_f, end_f, ik_f, name_f, add_attr_cb, clamp_
         cmds.warning('Please fill start, mid, end joints and IK handle fields.')
         return
 
-    try:
-        import StretchSystemTool
-    except Exception:
+    if _create_stretch is None:
         cmds.warning('Could not import StretchSystemTool. Ensure it is in your script path.')
         return
 
     # run inside an undo chunk
     try:
         cmds.undoInfo(openChunk=True)
-        StretchSystemTool.create_stretch_ik_chain(ik_handle=ik, start_jnt=start, mid_jnt=mid, end_jnt=end, name=name or None, clamp_min=clamp_min, add_attr=add_attr)
+        _create_stretch(ik_handle=ik, start_jnt=start, mid_jnt=mid, end_jnt=end, name=name or None, clamp_min=clamp_min, add_attr=add_attr)
     except Exception as e:
         cmds.warning(f'Error creating stretch system: {e}')
     finally:
@@ -102,19 +114,20 @@ def show_ui():
     cmds.button(label='Close', command=lambda *a: cmds.deleteUI(win))
     cmds.setParent('..')
 
+    _update_sel_cache()
+    cmds.scriptJob(event=('SelectionChanged', _update_sel_cache), parent=win)
+
     cmds.showWindow(win)
 
 
 def _create_from_selection_shortcut(name_f, add_attr_cb, clamp_cb):
-    sel = cmds.ls(selection=True) or []
+    sel = _SEL_CACHE['sel']
     if len(sel) < 4:
         cmds.warning('Select start, mid, end joints and an IK handle (4 items) before pressing this.')
         return
     start, mid, end, ik = sel[0:4]
 
-    try:
-        import StretchSystemTool
-    except Exception:
+    if _create_stretch is None:
         cmds.warning('Could not import StretchSystemTool. Ensure it is in your script path.')
         return
 
@@ -124,7 +137,7 @@ def _create_from_selection_shortcut(name_f, add_attr_cb, clamp_cb):
 
     try:
         cmds.undoInfo(openChunk=True)
-        StretchSystemTool.create_stretch_ik_chain(ik_handle=ik, start_jnt=start, mid_jnt=mid, end_jnt=end, name=name, clamp_min=clamp_min, add_attr=add_attr)
+        _create_stretch(ik_handle=ik, start_jnt=start, mid_jnt=mid, end_jnt=end, name=name, clamp_min=clamp_min, add_attr=add_attr)
     except Exception as e:
         cmds.warning(f'Error creating stretch system: {e}')
     finally: